@@ -17,14 +17,18 @@ minute, even we proactively stop the daemons, they will be restarted
 within 1 minute, we did NOT change cx behavior and provide the
 capability to stop the daemons as improvements in future.
 
-Standard retry policy applied to both SageMaker and Glue clients to
-handle throttling or HTTP 500s.
+Adaptive retry policy applied to both SageMaker and Glue clients to
+handle throttling or HTTP 500s, falling back to the legacy policy
+when the installed botocore predates retry modes.
 
 @author: zhenpenz
 @version: v1.0
 """
 import argparse
+import functools
 import pathlib
+import random
+import socket
 import subprocess
 import time
 import json
@@ -32,19 +36,27 @@ import os
 import logging
 from logging import handlers
 import requests
+from requests.adapters import HTTPAdapter
 import boto3
 from botocore.config import Config
+from botocore.exceptions import BotoCoreError
 
 RECONNECT_INTERVAL_IN_SEC = 300
 SWITCH_INTERVAL_IN_SEC = 30
+RECONNECT_MAX_INTERVAL_IN_SEC = 1800
+SWITCH_MAX_INTERVAL_IN_SEC = 300
+# double the daemon interval after this many stable ticks, up to 8x
+STABLE_TICKS_PER_DOUBLING = 10
+MAX_INTERVAL_DOUBLINGS = 3
 MAX_FAIL_DURATION_IN_HOUR = 48
 HOUR_IN_SEC = 3600
 DEV_ENDPOINT_HEARTBEAT_INTERVAL_IN_SEC = 3600
-RECONNECT_MAX_FAIL_COUNT = ((HOUR_IN_SEC / RECONNECT_INTERVAL_IN_SEC) *
+RECONNECT_MAX_FAIL_COUNT = ((HOUR_IN_SEC // RECONNECT_INTERVAL_IN_SEC) *
                             MAX_FAIL_DURATION_IN_HOUR)
-SWITCH_MAX_FAIL_COUNT = ((HOUR_IN_SEC / SWITCH_INTERVAL_IN_SEC) *
+SWITCH_MAX_FAIL_COUNT = ((HOUR_IN_SEC // SWITCH_INTERVAL_IN_SEC) *
                          MAX_FAIL_DURATION_IN_HOUR)
 UPDATE_DEV_ENDPOINT_TIMEOUT_IN_SEC = 600
+RECONNECT_META_TTL_IN_SEC = 60
 LIVY_SERVER_TIMEOUT_IN_SEC = 300
 LIVY_PING_TIMEOUT_IN_SEC = 10
 WAIT_DEV_ENDPOINT_READY_INTERVAL_IN_SEC = 5
@@ -58,6 +70,20 @@ NOTEBOOK_ARN_PATH = "/opt/ml/metadata/resource-metadata.json"
 GLUE_ENDPOINT_PATH = "/home/ec2-user/glue/glue_endpoint.txt"
 CURRENT_DEV_ENDPOINT_PATH = "/home/ec2-user/glue/current_dev_endpoint"
 LIVY_SERVER_URL = "http://localhost:8998"
+LIVY_SERVER_HOST = "localhost"
+LIVY_SERVER_PORT = 8998
+LIVY_PROBE_TIMEOUT_IN_SEC = 1
+LIVY_TUNNEL_POLL_INTERVAL_IN_SEC = 0.2
+
+DEPENDENCY_WHEEL_PATHS = [
+    "/home/ec2-user/glue/idna-2.7-py2.py3-none-any.whl",
+    "/home/ec2-user/glue/chardet-3.0.4-py2.py3-none-any.whl",
+    "/home/ec2-user/glue/certifi-2018.8.24-py2.py3-none-any.whl",
+    "/home/ec2-user/glue/requests-2.19.1-py2.py3-none-any.whl",
+    "/home/ec2-user/glue/botocore-1.12.10-py2.py3-none-any.whl",
+    "/home/ec2-user/glue/boto3-1.9.10-py2.py3-none-any.whl",
+    "/home/ec2-user/glue/urllib3-1.23-py2.py3-none-any.whl",
+]
 
 PUBLIC_KEY = "PublicKey"
 PUBLIC_KEYS = "PublicKeys"
@@ -80,13 +106,51 @@ formatter = logging.Formatter(
 fh.setFormatter(formatter)
 logger.addHandler(fh)
 
-retry_config = Config(
-    retries={
-        "max_attempts": 20
-    }
-)
+# shared HTTP session so Livy probes reuse the loopback TCP
+# connection instead of opening a fresh socket per poll
+_http = requests.Session()
+_http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+try:
+    retry_config = Config(
+        retries={
+            "max_attempts": 10,
+            "mode": "adaptive"
+        },
+        max_pool_connections=50,
+        connect_timeout=5,
+        read_timeout=30
+    )
+# bundled botocore (1.12.10) predates retry modes and rejects the
+# "mode" key, fall back to the legacy retry policy there
+except BotoCoreError:
+    retry_config = Config(
+        retries={
+            "max_attempts": 20
+        },
+        max_pool_connections=50,
+        connect_timeout=5,
+        read_timeout=30
+    )
+
+
+def _backoff(attempt, base=1.0, cap=30.0):
+    """Get jittered exponential backoff delay.
+
+    Full jitter keeps concurrent notebooks from retrying in lockstep
+    and piling up throttled Glue/SageMaker calls.
+
+    :param attempt: zero-based attempt count.
+    :param base: base delay in seconds.
+    :param cap: max delay in seconds.
+    :return: delay in seconds in [0, min(cap, base * 2**attempt)].
+    """
+    # clamp the exponent so large attempt counts (daemons pass their
+    # raw failed_count) can't overflow the float multiply
+    return random.uniform(0, min(cap, base * 2 ** min(attempt, 30)))
 
 
+@functools.lru_cache(maxsize=1)
 def get_glue_endpoint():
     """Get Glue service endpoint.
 
@@ -116,9 +180,14 @@ def get_autossh_host():
         raise
 
 
+@functools.lru_cache(maxsize=1)
 def get_public_key():
     """Get notebook's Public Key.
 
+    Cached as the key only rotates on generate_ssh_keypair, which
+    clears the cache; daemons would otherwise re-read the file on
+    every tick.
+
     :return: notebook's Public Key.
     """
     try:
@@ -134,14 +203,22 @@ def get_public_key():
         raise
 
 
+@functools.lru_cache(maxsize=1)
+def _load_resource_metadata():
+    """Load notebook resource metadata, parsed once per process.
+
+    :return: resource metadata dict.
+    """
+    with open(NOTEBOOK_ARN_PATH) as json_file:
+        return json.load(json_file)
+
+
 def get_notebook_arn():
     """Get notebook arn.
 
     :return: Notebook arn.
     """
-    with open(NOTEBOOK_ARN_PATH) as json_file:
-        data = json.load(json_file)
-        return data.get("ResourceArn")
+    return _load_resource_metadata().get("ResourceArn")
 
 
 def get_notebook_name():
@@ -149,9 +226,12 @@ def get_notebook_name():
 
     :return: Notebook name.
     """
-    with open(NOTEBOOK_ARN_PATH) as json_file:
-        data = json.load(json_file)
-        return data.get("ResourceName")
+    return _load_resource_metadata().get("ResourceName")
+
+
+# (mtime, contents) of current_dev_endpoint file, so switch_daemon
+# ticks only stat the file instead of re-reading it every 30s
+_current_dev_endpoint_cache = (None, None)
 
 
 def get_current_dev_endpoint():
@@ -159,10 +239,18 @@ def get_current_dev_endpoint():
 
     :return: DevEndpoint name notebook is currently connected.
     """
+    global _current_dev_endpoint_cache
     try:
-        if os.path.exists(CURRENT_DEV_ENDPOINT_PATH):
-            with open(CURRENT_DEV_ENDPOINT_PATH) as file:
-                return file.read()
+        mtime = os.stat(CURRENT_DEV_ENDPOINT_PATH).st_mtime
+        cached_mtime, cached_name = _current_dev_endpoint_cache
+        if mtime == cached_mtime:
+            return cached_name
+        with open(CURRENT_DEV_ENDPOINT_PATH) as file:
+            dev_endpoint_name = file.read()
+        _current_dev_endpoint_cache = (mtime, dev_endpoint_name)
+        return dev_endpoint_name
+    except FileNotFoundError:
+        pass
     except IOError:
         logger.warning("Failed to load current_dev_endpoint", exc_info=True)
     return None
@@ -175,8 +263,14 @@ def save_current_dev_endpoint(dev_endpoint_name):
     """
     logger.info(f"Saving current_dev_endpoint={dev_endpoint_name}")
     try:
-        with open(CURRENT_DEV_ENDPOINT_PATH, "w") as file:
+        # write to a temp file and rename so a crash mid-write can't
+        # leave a partial file that triggers spurious reconnects
+        tmp_path = CURRENT_DEV_ENDPOINT_PATH + ".tmp"
+        with open(tmp_path, "w") as file:
             file.write(dev_endpoint_name)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, CURRENT_DEV_ENDPOINT_PATH)
         logger.info(f"Saved current_dev_endpoint={dev_endpoint_name}")
     except IOError:
         logger.error(
@@ -197,18 +291,17 @@ def remove_dev_endpoint(dev_endpoint_name):
 
     :param dev_endpoint_name: DevEndpoint name.
     """
-    if os.path.exists(CURRENT_DEV_ENDPOINT_PATH):
-        logger.info(f"Removing current_dev_endpoint={dev_endpoint_name}")
-        try:
-            os.remove(CURRENT_DEV_ENDPOINT_PATH)
-            logger.info(f"Removed current_dev_endpoint={dev_endpoint_name}")
-        except IOError:
-            logger.error(
-                f"Failed to remove current_dev_endpoint={dev_endpoint_name}",
-                exc_info=True)
-            raise
-    else:
+    logger.info(f"Removing current_dev_endpoint={dev_endpoint_name}")
+    try:
+        os.remove(CURRENT_DEV_ENDPOINT_PATH)
+        logger.info(f"Removed current_dev_endpoint={dev_endpoint_name}")
+    except FileNotFoundError:
         logger.info(f"current_dev_endpoint={dev_endpoint_name} absent")
+    except IOError:
+        logger.error(
+            f"Failed to remove current_dev_endpoint={dev_endpoint_name}",
+            exc_info=True)
+        raise
 
 
 def get_latest_dev_endpoint():
@@ -220,12 +313,11 @@ def get_latest_dev_endpoint():
     :return: latest DevEndpoint name.
     """
     dev_endpoint_tags = sagemaker_client.list_tags(
-        ResourceArn=notebook_arn).get('Tags')
-    dev_endpoint_names = list(
-        filter(lambda x: x['Key'] == 'aws-glue-dev-endpoint',
-               dev_endpoint_tags))
-    if dev_endpoint_names:
-        dev_endpoint_name = dev_endpoint_names[0]['Value']
+        ResourceArn=notebook_arn).get('Tags', ())
+    dev_endpoint_name = next(
+        (tag['Value'] for tag in dev_endpoint_tags
+         if tag['Key'] == 'aws-glue-dev-endpoint'), None)
+    if dev_endpoint_name:
         return dev_endpoint_name
     raise ValueError("Unable to get latest DevEndpoint from notebook tag")
 
@@ -267,34 +359,47 @@ glue_client = get_glue_client(glue_endpoint)
 
 
 def install_dependencies():
-    """Install dependencies, only install when notebook starts."""
+    """Install dependencies, only install when notebook starts.
+
+    One pip invocation installs all wheels; installing them in
+    parallel pip processes would pay pip startup per wheel again and
+    risk concurrent writes to site-packages for no gain, as a single
+    --no-deps install of local wheels is already resolver- and
+    network-free.
+    """
     try:
         from pip import main as pipmain
     # TODO refactor later
     except Exception:
         from pip._internal import main as pipmain
-    pipmain(['install',
-             "/home/ec2-user/glue/idna-2.7-py2.py3-none-any.whl"])
-    pipmain(['install',
-             "/home/ec2-user/glue/chardet-3.0.4-py2.py3-none-any.whl"])
-    pipmain(['install',
-             "/home/ec2-user/glue/certifi-2018.8.24-py2.py3-none-any.whl"])
-    pipmain(['install',
-             "/home/ec2-user/glue/requests-2.19.1-py2.py3-none-any.whl"])
-    pipmain(['install',
-             "/home/ec2-user/glue/botocore-1.12.10-py2.py3-none-any.whl"])
-    pipmain(['install',
-             "/home/ec2-user/glue/boto3-1.9.10-py2.py3-none-any.whl"])
-    pipmain(['install',
-             "/home/ec2-user/glue/urllib3-1.23-py2.py3-none-any.whl"])
+    # all wheels are local and the set is fixed, --no-deps skips
+    # network resolution entirely
+    pipmain(['install', '--no-deps', *DEPENDENCY_WHEEL_PATHS])
+
+
+# initctl configuration only needs reloading once per process, not
+# on every autossh restart during a reconnect loop
+_initctl_reloaded = False
+
+
+def _initctl(*args):
+    """Run an initctl command, discarding output.
+
+    :param args: initctl arguments.
+    """
+    subprocess.run(['/usr/bin/sudo', '/sbin/initctl', *args], check=False,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
 def start_autossh():
     """Start autossh."""
+    global _initctl_reloaded
     autossh_host = get_autossh_host()
     logger.info(f'Starting autossh tunnel to Livy {autossh_host}')
-    subprocess.call(['/usr/bin/sudo', '/sbin/initctl', 'reload-configuration'])
-    subprocess.call(['/usr/bin/sudo', '/sbin/initctl', 'start', 'autossh'])
+    if not _initctl_reloaded:
+        _initctl('reload-configuration')
+        _initctl_reloaded = True
+    _initctl('start', 'autossh')
     logger.info(f'Started autossh tunnel to Livy {autossh_host}')
 
 
@@ -302,14 +407,14 @@ def stop_autossh():
     """Stop autossh."""
     autossh_host = get_autossh_host()
     logger.info(f'Stopping autossh tunnel from Livy {autossh_host}')
-    subprocess.call(['/usr/bin/sudo', '/sbin/initctl', 'stop', 'autossh'])
+    _initctl('stop', 'autossh')
     logger.info(f'Stopped autossh tunnel from Livy {autossh_host}')
 
 
 def ping_livy():
     """Ping livy server to check service is up."""
     logger.info("Pinging Livy...")
-    requests.get(url=LIVY_SERVER_URL, timeout=LIVY_SERVER_TIMEOUT_IN_SEC)
+    _http.get(url=LIVY_SERVER_URL, timeout=LIVY_SERVER_TIMEOUT_IN_SEC)
     logger.info("Pinged Livy")
 
 
@@ -330,6 +435,7 @@ def generate_ssh_keypair():
         ['/usr/bin/ssh-keygen', '-f', SSH_KEY_PRIVATE_PATH, '-C',
          notebook_name, '-N', '']))
     os.chmod(SSH_KEY_PRIVATE_PATH, 0o0400)
+    get_public_key.cache_clear()
     public_key = get_public_key()
     logger.info(f"Generated SSH keypair {public_key}")
 
@@ -343,8 +449,8 @@ def add_public_key(dev_endpoint_name):
     wait_dev_endpoint_ready(dev_endpoint_name)
     logger.info(f"Adding public_key={public_key} to "
                 f"dev_endpoint={dev_endpoint_name}")
-    glue_client.update_dev_endpoint(EndpointName=dev_endpoint_name,
-                                    AddPublicKeys=[public_key])
+    _update_dev_endpoint(EndpointName=dev_endpoint_name,
+                         AddPublicKeys=[public_key])
     wait_dev_endpoint_ready(dev_endpoint_name)
     logger.info(f"Added public_key={public_key} to "
                 f"dev_endpoint={dev_endpoint_name}")
@@ -394,12 +500,12 @@ def delete_public_keys(dev_endpoint_name, public_keys_to_delete):
     :param dev_endpoint_name: DevEndpoint name.
     :param public_keys_to_delete: Public Keys to be deleted.
     """
-    wait_dev_endpoint_ready(dev_endpoint_name)
     if public_keys_to_delete:
+        wait_dev_endpoint_ready(dev_endpoint_name)
         logger.info(f"Deleting public_keys={public_keys_to_delete} "
                     f"from dev_endpoint={dev_endpoint_name}")
-        glue_client.update_dev_endpoint(EndpointName=dev_endpoint_name,
-                                        DeletePublicKeys=public_keys_to_delete)
+        _update_dev_endpoint(EndpointName=dev_endpoint_name,
+                             DeletePublicKeys=public_keys_to_delete)
         wait_dev_endpoint_ready(dev_endpoint_name)
         logger.info(f"Deleted public_keys={public_keys_to_delete} "
                     f"from dev_endpoint={dev_endpoint_name}")
@@ -425,23 +531,58 @@ def has_public_key(dev_endpoint):
     return False
 
 
+# (dev_endpoint_name, confirmed_time) of the last confirmed-ready
+# poll, so paired waits around update_dev_endpoint calls don't each
+# run a full polling loop
+_last_ready = (None, 0.0)
+
+
+def _update_dev_endpoint(**kwargs):
+    """Update DevEndpoint and invalidate the last-ready record.
+
+    :param kwargs: UpdateDevEndpoint request parameters.
+    """
+    global _last_ready
+    _last_ready = (None, 0.0)
+    glue_client.update_dev_endpoint(**kwargs)
+
+
 def wait_dev_endpoint_ready(dev_endpoint_name):
     """Wait for DevEndpoint to be ready.
 
     As dev endpoint doesn't allow concurrent update, wait it ready.
+    Skipped when readiness of the same DevEndpoint was confirmed
+    moments ago and no update was issued since.
 
     :param dev_endpoint_name: DevEndpoint name.
     """
+    global _last_ready
+    last_ready_name, last_ready_time = _last_ready
+    if (last_ready_name == dev_endpoint_name and
+            (time.time() - last_ready_time) <
+            WAIT_DEV_ENDPOINT_READY_INTERVAL_IN_SEC):
+        logger.info(f'dev_endpoint={dev_endpoint_name} recently confirmed '
+                    'ready, skipping wait')
+        return
     start = time.time()
+    attempt = 0
+    last_update_status = None
     while (time.time() - start) < UPDATE_DEV_ENDPOINT_TIMEOUT_IN_SEC:
         logger.info(f'Waiting dev_endpoint={dev_endpoint_name} ready')
-        time.sleep(WAIT_DEV_ENDPOINT_READY_INTERVAL_IN_SEC)
+        time.sleep(_backoff(attempt))
+        attempt += 1
         dev_endpoint = glue_client.get_dev_endpoint(
             EndpointName=dev_endpoint_name)[DEV_ENDPOINT]
         if LAST_UPDATE_STATUS not in dev_endpoint:
+            _last_ready = (dev_endpoint_name, time.time())
             break
+        # restart backoff whenever the update makes progress
+        if dev_endpoint[LAST_UPDATE_STATUS] != last_update_status:
+            last_update_status = dev_endpoint[LAST_UPDATE_STATUS]
+            attempt = 0
         if dev_endpoint[LAST_UPDATE_STATUS] == COMPLETED:
             logger.info(f'dev_endpoint={dev_endpoint_name} ready')
+            _last_ready = (dev_endpoint_name, time.time())
             break
         if dev_endpoint[LAST_UPDATE_STATUS] == FAILED:
             error_msg = ("LastUpdateStatus is FAILED, "
@@ -454,14 +595,16 @@ def wait_dev_endpoint_ready(dev_endpoint_name):
 def is_dev_endpoint_connected():
     """Is current notebook connected to current_dev_endpoint.
 
-    Checking if Livy is up.
+    Checking if Livy port accepts connections; a raw TCP connect is
+    enough here and much cheaper than a full HTTP round-trip.
 
     :return: is DevEndpoint connected.
     """
     try:
-        requests.get(url=LIVY_SERVER_URL, timeout=LIVY_PING_TIMEOUT_IN_SEC)
-        return True
-    except requests.exceptions.ConnectionError:
+        with socket.create_connection((LIVY_SERVER_HOST, LIVY_SERVER_PORT),
+                                      timeout=LIVY_PROBE_TIMEOUT_IN_SEC):
+            return True
+    except OSError:
         return False
 
 
@@ -514,8 +657,15 @@ def connect_dev_endpoint(dev_endpoint_name):
     generate_ssh_keypair()
     add_public_key(dev_endpoint_name)
     start_autossh()
-    logger.info(f"Waiting {LIVY_PING_TIMEOUT_IN_SEC} seconds for tunnel ready")
-    time.sleep(LIVY_PING_TIMEOUT_IN_SEC)
+    logger.info(f"Waiting up to {LIVY_PING_TIMEOUT_IN_SEC} seconds for "
+                "tunnel ready")
+    # poll instead of a fixed sleep so connect returns as soon as the
+    # tunnel is up, typically well under a second
+    deadline = time.time() + LIVY_PING_TIMEOUT_IN_SEC
+    while time.time() < deadline:
+        if is_dev_endpoint_connected():
+            break
+        time.sleep(LIVY_TUNNEL_POLL_INTERVAL_IN_SEC)
     ping_livy()
     save_current_dev_endpoint(dev_endpoint_name)
     update_connection_tag()
@@ -536,22 +686,31 @@ def disconnect_dev_endpoint(dev_endpoint_name):
     logger.info(f"Disconnected from dev_endpoint={dev_endpoint_name}")
 
 
+# (dev_endpoint_name, checked_time, has_public_key) from the last
+# Glue check, so transient Livy blips retry autossh without another
+# get_dev_endpoint round-trip
+_last_reconnect_meta = (None, 0.0, False)
+
+
 def reconnect_dev_endpoint(dev_endpoint_name):
     """Reconnect DevEndpoint if disconnected.
 
     Follow below steps to reconnect:
       1. If Livy is up, DevEndpoint is assumed connected.
-      2. If DevEndpoint is deleted, throwing exception all the way up
+      2. If public_key presence was confirmed within the last minute,
+         restart autossh without calling Glue.
+      3. If DevEndpoint is deleted, throwing exception all the way up
          and failed_count will be incremented.
-      3. If DevEndpoint is updating, re-check in next round.
-      4. If DevEndpoint has notebook's public_key, restart autossh.
-      5. If Livy is down after restarting autossh, reconnect to
+      4. If DevEndpoint is updating, re-check in next round.
+      5. If DevEndpoint has notebook's public_key, restart autossh.
+      6. If Livy is down after restarting autossh, reconnect to
          DevEndpoint.
-      5. If DevEndpoint doesn't have notebook's public_key, reconnect
+      7. If DevEndpoint doesn't have notebook's public_key, reconnect
          to DevEndpoint.
 
     :param dev_endpoint_name: DevEndpoint name.
     """
+    global _last_reconnect_meta
     if not dev_endpoint_name:
         logger.warning("current_dev_endpoint absent")
         return
@@ -562,6 +721,21 @@ def reconnect_dev_endpoint(dev_endpoint_name):
     else:
         logger.info(f"dev_endpoint={dev_endpoint_name} is connected")
         return
+    # Quick autossh restart if public_key was confirmed recently,
+    # avoiding a Glue API call during brief autossh drops
+    meta_name, meta_time, meta_has_key = _last_reconnect_meta
+    if (meta_name == dev_endpoint_name and meta_has_key and
+            (time.time() - meta_time) < RECONNECT_META_TTL_IN_SEC):
+        logger.info(f"Public Key recently confirmed in "
+                    f"dev_endpoint={dev_endpoint_name}, "
+                    "restarting autossh without Glue check...")
+        stop_autossh()
+        start_autossh()
+        if is_dev_endpoint_connected():
+            logger.info(f"dev_endpoint={dev_endpoint_name} reconnected now")
+            return
+        logger.warning(f"dev_endpoint={dev_endpoint_name} still disconnected "
+                       "after quick restart, running full check...")
     # Skip if DevEndpoint is updating
     dev_endpoint = glue_client.get_dev_endpoint(
         EndpointName=dev_endpoint_name)[DEV_ENDPOINT]
@@ -571,6 +745,8 @@ def reconnect_dev_endpoint(dev_endpoint_name):
         return
     # Restart autossh if DevEndpoint has notebook's public_key
     public_key_present = has_public_key(dev_endpoint)
+    _last_reconnect_meta = (dev_endpoint_name, time.time(),
+                            public_key_present)
     if public_key_present:
         logger.info(f"Public Key is in dev_endpoint={dev_endpoint_name}, "
                     "restarting autossh...")
@@ -590,6 +766,23 @@ def reconnect_dev_endpoint(dev_endpoint_name):
     logger.info(f"dev_endpoint={dev_endpoint_name} reconnected now")
 
 
+def _daemon_interval(base_interval, max_interval, stable_count):
+    """Get daemon sleep interval stretched after sustained stability.
+
+    Doubles the base interval every STABLE_TICKS_PER_DOUBLING stable
+    ticks up to MAX_INTERVAL_DOUBLINGS doublings, bounded by
+    max_interval, so idle notebooks poll less often.
+
+    :param base_interval: base interval in seconds.
+    :param max_interval: max interval in seconds.
+    :param stable_count: consecutive no-op ticks.
+    :return: interval in seconds.
+    """
+    doublings = min(stable_count // STABLE_TICKS_PER_DOUBLING,
+                    MAX_INTERVAL_DOUBLINGS)
+    return min(max_interval, base_interval * (2 ** doublings))
+
+
 def reconnect_daemon():
     """Daemon for reconnecting DevEndpoint.
 
@@ -598,19 +791,27 @@ def reconnect_daemon():
     """
     logger.info("reconnect_daemon started")
     failed_count = 0
+    stable_count = 0
     while failed_count < RECONNECT_MAX_FAIL_COUNT:
         logger.info("reconnect_daemon checking")
         try:
             current_dev_endpoint = get_current_dev_endpoint()
             reconnect_dev_endpoint(current_dev_endpoint)
             failed_count = 0
+            stable_count += 1
         # catch all exceptions until keeps failing and stop
         except Exception:
             failed_count += 1
+            stable_count = 0
             logger.error(f"reconnect_daemon failed_count={failed_count}",
                          exc_info=True)
+            # jittered backoff on top of the steady interval to
+            # spread retries after consecutive failures
+            time.sleep(_backoff(failed_count))
         # notebook restart expects to execute immediately
-        time.sleep(RECONNECT_INTERVAL_IN_SEC)
+        time.sleep(_daemon_interval(RECONNECT_INTERVAL_IN_SEC,
+                                    RECONNECT_MAX_INTERVAL_IN_SEC,
+                                    stable_count))
     logger.error(f"reconnect_daemon stopped, failed_count={failed_count}")
 
 
@@ -626,6 +827,7 @@ def switch_daemon():
     """
     logger.info("switch_daemon started")
     failed_count = 0
+    stable_count = 0
     while failed_count < SWITCH_MAX_FAIL_COUNT:
         logger.info("switch_daemon checking")
         try:
@@ -633,6 +835,7 @@ def switch_daemon():
             latest_dev_endpoint = get_latest_dev_endpoint()
             is_changed = (current_dev_endpoint != latest_dev_endpoint)
             if is_changed:
+                stable_count = 0
                 logger.info("dev_endpoint changing from "
                             f"{current_dev_endpoint} to {latest_dev_endpoint}")
                 if current_dev_endpoint:
@@ -643,14 +846,21 @@ def switch_daemon():
                 logger.info("dev_endpoint changed from "
                             f"{current_dev_endpoint} to {latest_dev_endpoint}")
             else:
+                stable_count += 1
                 logger.info(f"dev_endpoint={latest_dev_endpoint} not changed")
             failed_count = 0
         # catch all exceptions until keeps failing and stop
         except Exception:
             failed_count += 1
+            stable_count = 0
             logger.error(f"switch_daemon failed_count={failed_count}",
                          exc_info=True)
-        time.sleep(SWITCH_INTERVAL_IN_SEC)
+            # jittered backoff on top of the steady interval to
+            # spread retries after consecutive failures
+            time.sleep(_backoff(failed_count))
+        time.sleep(_daemon_interval(SWITCH_INTERVAL_IN_SEC,
+                                    SWITCH_MAX_INTERVAL_IN_SEC,
+                                    stable_count))
     logger.error(f"switch_daemon stopped, failed_count={failed_count}")
 
 
@@ -11,11 +11,20 @@ SageMaker LCC to access the logs.
 """
 import time
 import requests
+from requests.adapters import HTTPAdapter
 
 # wait livy connection timeout, 30 min in case of region slow
 LIVY_SERVER_TIMEOUT_IN_SEC = 1800
 LIVY_SERVER_URL = "http://localhost:8998"
 LIVY_PING_TIMEOUT_IN_SEC = 5
+# retry delay grows from 1s up to this cap
+MAX_RETRY_DELAY_IN_SEC = 30
+
+# shared session keeps the loopback TCP connection alive across
+# probes instead of opening a fresh socket per attempt
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                      max_retries=0))
 
 
 # Sagemaker notebook lifecycle configuration timeout is 5 minutes.
@@ -23,15 +32,18 @@ def wait_for_livy_connection():
     """Wait Livy server up."""
     print('Waiting for livy connection')
     start = time.time()
+    delay = 1.0
     while (time.time() - start) < LIVY_SERVER_TIMEOUT_IN_SEC:
         try:
-            requests.get(url=LIVY_SERVER_URL, timeout=LIVY_PING_TIMEOUT_IN_SEC)
+            _session.get(url=LIVY_SERVER_URL,
+                         timeout=LIVY_PING_TIMEOUT_IN_SEC)
             print('Livy connection OK')
             return
         except requests.exceptions.ConnectionError:
             print('Livy connection failed, sleeping for '
-                  f'{LIVY_PING_TIMEOUT_IN_SEC} seconds.')
-            time.sleep(LIVY_PING_TIMEOUT_IN_SEC)
+                  f'{delay:.1f} seconds.')
+            time.sleep(delay)
+            delay = min(MAX_RETRY_DELAY_IN_SEC, delay * 1.5)
 
     error_msg = ("Livy connection timeout after "
                  f"{LIVY_SERVER_TIMEOUT_IN_SEC} seconds")